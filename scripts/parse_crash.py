@@ -1,4 +1,8 @@
 #!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["orjson", "ijson"]
+# ///
 """
 Parse iOS crash reports (.ips files) and display relevant information.
 
@@ -8,56 +12,275 @@ Usage:
     uv run scripts/parse_crash.py --latest 3  # Show last 3 crashes
 
 The .ips format contains a header JSON object followed by the main crash data.
+
+The module is fully annotated, so it can be compiled with mypyc for faster
+frame processing on large crash batches:
+    cd scripts && mypyc --ignore-missing-imports parse_crash.py
+    python -c 'import parse_crash; parse_crash.main()' --latest 3
 """
 
 import json
+import mmap
+import re
 import sys
 import os
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Iterator, TypedDict
+
+# orjson decodes the large, string-heavy crash JSON much faster than the
+# stdlib decoder. Fall back to json when it isn't installed.
+json_loads: Callable[..., Any]
+JSONDecodeError: type[json.JSONDecodeError]
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+    HAVE_ORJSON = True
+except ImportError:
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+    HAVE_ORJSON = False
+
+# Where macOS writes crash reports (including simulator app crashes)
+CRASH_DIR = os.path.expanduser('~/Library/Logs/DiagnosticReports')
+
+# Section separators used by the report formatters
+SEP_EQ = '=' * 60
+SEP_DASH = '-' * 60
+
+# Top-level crash keys the formatted/raw/origin views read. Everything else
+# (binaryImages, legacyInfo, ...) is skipped while streaming.
+STREAM_KEYS = ('exception', 'termination', 'asi', 'usedImages', 'threads')
+
+# orjson's full parse is several times faster than streaming with ijson, so
+# only files above this size are streamed, to keep their memory bounded.
+STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# The --raw and --origin views only read the crashed thread's frames and the
+# images they point into.
+STACK_KEYS = ('usedImages', 'threads')
+
+# Substrings that mark panic/signal handler frames. Each set is compiled into a
+# single alternation so a frame is classified in one pass over its symbol.
+PANIC_KEYWORDS = ('panic', 'abort', 'sigtramp', 'signalhandler', 'pthread_kill',
+                  'ubsan', 'asan', 'breakpad', 'exception')
+PANIC_SYMBOLS = ('panicExtra', 'defaultPanic', 'SignalHandler', '_sigtramp',
+                 'pthread_kill', 'abort', '__ubsan_handle')
+THREAD_PANIC_SYMBOLS = PANIC_SYMBOLS + ('breakpad',)
+
+# The keywords are lowercase and matched against a lowercased symbol: an
+# re.IGNORECASE alternation is an order of magnitude slower on long symbols.
+PANIC_KEYWORDS_RE = re.compile('|'.join(map(re.escape, PANIC_KEYWORDS)))
+
+PANIC_SYMBOLS_RE = re.compile('|'.join(map(re.escape, PANIC_SYMBOLS)))
+THREAD_PANIC_SYMBOLS_RE = re.compile('|'.join(map(re.escape, THREAD_PANIC_SYMBOLS)))
+
+
+class Frame(TypedDict):
+    """A stack frame, after normalize_frames() has filled in missing fields."""
+    symbol: str
+    imageIndex: int
+    imageOffset: int
 
 
-def parse_ips_file(filepath: str) -> dict:
+class OriginFrame(TypedDict):
+    """A non-panic frame returned by find_crash_origin()."""
+    index: int
+    symbol: str
+    image: str
+    offset: int
+
+
+# ijson parse events: (prefix, event, value)
+Event = tuple[str, str, Any]
+
+# Frames are normalized when parsed (see normalize_frames), so the frame loops
+# can unpack every frame with a single call instead of three .get() lookups.
+FRAME_FIELDS = itemgetter('symbol', 'imageIndex', 'imageOffset')
+
+
+def normalize_frames(frames: list[Frame]) -> list[Frame]:
+    """Fill in missing frame fields in place so FRAME_FIELDS can unpack them."""
+    for frame in frames:
+        frame.setdefault('symbol', '')
+        frame.setdefault('imageIndex', 0)
+        frame.setdefault('imageOffset', 0)
+    return frames
+
+
+def json_loads_buffer(buf: memoryview) -> Any:
+    """Decode JSON from a buffer. Only the stdlib decoder needs a bytes copy."""
+    return json_loads(buf if HAVE_ORJSON else bytes(buf))
+
+
+def parse_ips_file(filepath: str) -> dict[str, Any]:
     """Parse an .ips file which contains multiple JSON objects."""
-    with open(filepath, 'r') as f:
-        content = f.read()
+    header: Any = None
+    crash_data: Any = None
+
+    with open(filepath, 'rb') as f:
+        # mmap can't map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return {'header': header, 'crash': crash_data}
+
+        # Map the file and decode the header and crash JSON through views of
+        # the mapping, instead of splitting and re-joining every line
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            # .ips files have a header JSON on line 1, then the main crash JSON
+            newline = mm.find(b'\n')
+            if newline == -1:
+                newline = len(mm)
+
+            # The views must be released before the mapping can be closed
+            with view[:newline] as header_json, view[newline + 1:] as main_json:
+                try:
+                    header = json_loads_buffer(header_json)
+                except JSONDecodeError:
+                    pass
 
-    # .ips files have a header JSON on line 1, then the main crash JSON
-    lines = content.strip().split('\n')
+                # The rest is the main crash JSON. An empty or whitespace-only
+                # body fails to decode and finds nothing line by line.
+                try:
+                    crash_data = json_loads_buffer(main_json)
+                except JSONDecodeError:
+                    # Try parsing just line by line for older formats
+                    for line in main_json.tobytes().split(b'\n'):
+                        try:
+                            data = json_loads(line)
+                            if 'threads' in data or 'exception' in data:
+                                crash_data = data
+                                break
+                        except JSONDecodeError:
+                            continue
+
+    if isinstance(crash_data, dict):
+        for thread in crash_data.get('threads', []):
+            normalize_frames(thread.get('frames', []))
+
+    return {'header': header, 'crash': crash_data}
 
-    # Try to find where the main JSON starts (usually line 2)
-    header = None
-    crash_data = None
 
+def _build_value(event: str, value: Any, events: Iterator[Event]) -> Any:
+    """Build one JSON value from an ijson event stream, starting at `event`."""
+    from ijson import ObjectBuilder
+
+    builder = ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+        _, event, value = next(events)
+
+
+def _stream_crashed_threads(events: Iterator[Event]) -> list[dict[str, Any]]:
+    """Consume the `threads` array, keeping only triggered threads.
+
+    Each thread is built and dropped one at a time, so memory stays bounded
+    by the largest thread rather than the whole array.
+    """
+    threads: list[dict[str, Any]] = []
+    _, event, value = next(events)
+    if event != 'start_array':
+        _build_value(event, value, events)
+        return threads
+
+    index = 0
+    for prefix, event, value in events:
+        if prefix == 'threads' and event == 'end_array':
+            break
+        thread = _build_value(event, value, events)
+        if isinstance(thread, dict) and thread.get('triggered'):
+            # Preserve the thread's position, which is used when it has no id
+            thread.setdefault('id', index)
+            normalize_frames(thread.get('frames', []))
+            threads.append(thread)
+        index += 1
+
+    return threads
+
+
+def parse_ips_streaming(filepath: str, keys: tuple[str, ...] = STREAM_KEYS) -> dict[str, Any]:
+    """Parse an .ips file, materializing only the top-level crash `keys`.
+
+    Only triggered threads are kept. Falls back to parse_ips_file() when
+    ijson is unavailable or the file isn't in the usual header + JSON form.
+    """
+    # ijson is only needed for files above STREAM_THRESHOLD, so it is imported
+    # here rather than on every run. It picks the fastest available backend
+    # (yajl2_c, then pure Python).
     try:
-        header = json.loads(lines[0])
-    except json.JSONDecodeError:
-        pass
+        import ijson
+    except ImportError:
+        return parse_ips_file(filepath)
 
-    # The rest is the main crash JSON
-    if len(lines) > 1:
-        main_json = '\n'.join(lines[1:])
+    with open(filepath, 'rb') as f:
         try:
-            crash_data = json.loads(main_json)
-        except json.JSONDecodeError as e:
-            # Try parsing just line by line for older formats
-            for i, line in enumerate(lines):
-                try:
-                    data = json.loads(line)
-                    if 'threads' in data or 'exception' in data:
-                        crash_data = data
-                        break
-                except json.JSONDecodeError:
+            header = json_loads(f.readline())
+        except JSONDecodeError:
+            header = None
+
+        crash_data: dict[str, Any] = {}
+        events = ijson.parse(f, use_float=True)
+        try:
+            for prefix, event, value in events:
+                # Top-level keys; nested events are skipped without being built
+                if prefix != '' or event != 'map_key' or value not in keys:
                     continue
+                key = value
+                if key == 'threads':
+                    crash_data[key] = _stream_crashed_threads(events)
+                else:
+                    _, event, value = next(events)
+                    crash_data[key] = _build_value(event, value, events)
+        except (ijson.JSONError, StopIteration):
+            return parse_ips_file(filepath)
 
     return {'header': header, 'crash': crash_data}
 
 
-def find_crash_origin(data: dict) -> list:
+class ImageNames:
+    """Image file names by image index, resolved from usedImages on first use.
+
+    Reports list hundreds of images but only show a few dozen frames, so
+    names are only resolved for the images those frames point into.
+    """
+
+    def __init__(self, used_images: list[dict[str, Any]]) -> None:
+        self._used_images = used_images
+        self._names: list[str | None] = [None] * len(used_images)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> str:
+        name = self._names[index]
+        if name is None:
+            image_path = self._used_images[index].get('path', '')
+            name = Path(image_path).name if image_path else f'image_{index}'
+            self._names[index] = name
+        return name
+
+
+def parse_ips(filepath: str, keys: tuple[str, ...] = STREAM_KEYS) -> dict[str, Any]:
+    """Parse an .ips file, streaming only `keys` when it is too large to parse whole."""
+    if os.path.getsize(filepath) > STREAM_THRESHOLD:
+        return parse_ips_streaming(filepath, keys)
+    return parse_ips_file(filepath)
+
+
+def find_crash_origin(data: dict[str, Any]) -> list[OriginFrame]:
     """Find the original crash site by skipping panic/signal handler frames."""
     crash = data.get('crash', {})
     threads = crash.get('threads', [])
-    used_images = crash.get('usedImages', [])
+    image_names = ImageNames(crash.get('usedImages', []))
 
     crashed_thread = None
     for t in threads:
@@ -68,25 +291,22 @@ def find_crash_origin(data: dict) -> list:
     if not crashed_thread:
         return []
 
-    frames = crashed_thread.get('frames', [])
-    panic_keywords = ['panic', 'abort', 'sigtramp', 'signalhandler', 'pthread_kill',
-                      'ubsan', 'asan', 'breakpad', 'exception']
+    frames: list[Frame] = crashed_thread.get('frames', [])
+
+    # Hoist loop invariants into locals
+    image_count = len(image_names)
+    search_panic = PANIC_KEYWORDS_RE.search
 
-    origin_frames = []
+    origin_frames: list[OriginFrame] = []
+    append = origin_frames.append
     for i, frame in enumerate(frames):
-        symbol = frame.get('symbol', '')
-        img_idx = frame.get('imageIndex', 0)
-        img_offset = frame.get('imageOffset', 0)
+        symbol, img_idx, img_offset = FRAME_FIELDS(frame)
 
-        if img_idx < len(used_images):
-            img_path = used_images[img_idx].get('path', '')
-            img_name = Path(img_path).name if img_path else f'image_{img_idx}'
-        else:
-            img_name = f'image_{img_idx}'
+        img_name = image_names[img_idx] if img_idx < image_count else f'image_{img_idx}'
 
-        is_panic = any(kw in symbol.lower() for kw in panic_keywords)
+        is_panic = search_panic(symbol.lower()) is not None
         if not is_panic and symbol:
-            origin_frames.append({
+            append({
                 'index': i,
                 'symbol': symbol,
                 'image': img_name,
@@ -96,16 +316,16 @@ def find_crash_origin(data: dict) -> list:
     return origin_frames
 
 
-def format_crash_report(data: dict, filepath: str) -> str:
+def format_crash_report(data: dict[str, Any], filepath: str) -> str:
     """Format crash data into readable output."""
-    output = []
+    output: list[str] = []
     header = data.get('header', {})
     crash = data.get('crash', {})
 
     # File info
-    output.append(f"{'='*60}")
+    output.append(SEP_EQ)
     output.append(f"Crash Report: {Path(filepath).name}")
-    output.append(f"{'='*60}")
+    output.append(SEP_EQ)
 
     # Header info
     if header:
@@ -148,75 +368,77 @@ def format_crash_report(data: dict, filepath: str) -> str:
             break
 
     if crashed_thread:
-        output.append(f"\n{'='*60}")
+        output.append(f"\n{SEP_EQ}")
         output.append(f"Crashed Thread: {crashed_thread_idx}")
         if crashed_thread.get('name'):
             output.append(f"Thread Name: {crashed_thread.get('name')}")
-        output.append(f"{'='*60}")
+        output.append(SEP_EQ)
 
-        frames = crashed_thread.get('frames', [])
-        used_images = crash.get('usedImages', [])
+        frames: list[Frame] = crashed_thread.get('frames', [])
+        image_names = ImageNames(crash.get('usedImages', []))
 
-        # Filter out panic loop frames to find the original crash site
-        # Look for patterns like repeated panic/signal handler sequences
-        panic_symbols = {'panicExtra', 'defaultPanic', 'SignalHandler', '_sigtramp',
-                        'pthread_kill', 'abort', '__ubsan_handle'}
+        # Filter out panic loop frames to find the original crash site,
+        # formatting the first 50 relevant frames and spotting the likely
+        # origin in the same pass. The summary line is filled in afterwards,
+        # once we know whether the stack was cut short.
+        summary_idx = len(output)
+        output.append('')
+        output.append(SEP_DASH)
 
-        filtered_frames = []
+        # Hoist loop invariants into locals
+        image_count = len(image_names)
+        append = output.append
+
+        relevant_count = 0
         seen_panic_sequence = False
         panic_count = 0
+        origin_frame: Frame | None = None
+        truncated = False
 
         for frame in frames:
-            symbol = frame.get('symbol', '')
-            is_panic_frame = any(ps in symbol for ps in panic_symbols)
+            # Stop once 50 frames are shown. At most 9 frames (the first panic
+            # sequence) can be kept before a non-panic one, so the origin has
+            # already been found by then.
+            if relevant_count == 50:
+                truncated = True
+                break
+
+            symbol, image_idx, image_offset = FRAME_FIELDS(frame)
+            is_panic = PANIC_SYMBOLS_RE.search(symbol) is not None
 
-            if is_panic_frame:
+            # Look for patterns like repeated panic/signal handler sequences
+            if is_panic:
                 panic_count += 1
-                if panic_count <= 8:  # Show first panic sequence
-                    filtered_frames.append(frame)
-                elif not seen_panic_sequence:
-                    filtered_frames.append({'symbol': f'... ({panic_count - 8} more panic frames) ...'})
-                    seen_panic_sequence = True
+                if panic_count > 8:  # Show first panic sequence
+                    if not seen_panic_sequence:
+                        append(f"  {relevant_count:2d}: ... ({panic_count - 8} more panic frames) ...")
+                        relevant_count += 1
+                        seen_panic_sequence = True
+                    continue
             else:
-                filtered_frames.append(frame)
                 panic_count = 0
+                # Likely crash origin: the first non-panic frame
+                if origin_frame is None:
+                    origin_frame = frame
 
-        output.append(f"\nStack Trace ({len(frames)} total frames, showing {len(filtered_frames)} relevant):")
-        output.append("-" * 60)
-
-        for i, frame in enumerate(filtered_frames[:50]):
-            symbol = frame.get('symbol', '')
-            image_idx = frame.get('imageIndex', 0)
-            image_offset = frame.get('imageOffset', 0)
-
-            # Try to get image name
-            image_name = ''
-            if image_idx < len(used_images):
-                image_path = used_images[image_idx].get('path', '')
-                image_name = Path(image_path).name if image_path else f'image_{image_idx}'
+            image_name = image_names[image_idx] if image_idx < image_count else ''
 
             if symbol:
                 # Truncate long symbols
                 if len(symbol) > 100:
                     symbol = symbol[:97] + '...'
-                output.append(f"  {i:2d}: {symbol}")
+                append(f"  {relevant_count:2d}: {symbol}")
                 if image_name and image_offset:
-                    output.append(f"      ({image_name} + {image_offset})")
+                    append(f"      ({image_name} + {image_offset})")
             else:
-                output.append(f"  {i:2d}: {image_name} + {image_offset}")
+                append(f"  {relevant_count:2d}: {image_name} + {image_offset}")
+            relevant_count += 1
 
-        # Look for the likely crash origin (first non-panic frame after panic sequence)
-        origin_frame = None
-        in_panic = True
-        for frame in frames:
-            symbol = frame.get('symbol', '')
-            is_panic = any(ps in symbol for ps in panic_symbols)
-            if in_panic and not is_panic:
-                origin_frame = frame
-                break
+        shown = f"first {relevant_count}" if truncated else relevant_count
+        output[summary_idx] = f"\nStack Trace ({len(frames)} total frames, showing {shown} relevant):"
 
         if origin_frame:
-            origin_symbol = origin_frame.get('symbol', 'unknown')
+            origin_symbol = origin_frame['symbol'] or 'unknown'
             output.append(f"\n>>> LIKELY CRASH ORIGIN: {origin_symbol}")
     else:
         output.append("\nNo crashed thread found")
@@ -224,9 +446,9 @@ def format_crash_report(data: dict, filepath: str) -> str:
     # Show other relevant info
     asi = crash.get('asi', {})
     if asi:
-        output.append(f"\n{'='*60}")
+        output.append(f"\n{SEP_EQ}")
         output.append("Application Specific Information:")
-        output.append("-" * 60)
+        output.append(SEP_DASH)
         for key, value in asi.items():
             if isinstance(value, list):
                 for item in value:
@@ -237,18 +459,165 @@ def format_crash_report(data: dict, filepath: str) -> str:
     return '\n'.join(output)
 
 
-def get_latest_crashes(count: int = 1) -> list:
+def format_threads_report(data: dict[str, Any], filepath: str) -> str:
+    """Format every thread's interesting frames (useful for recursive panics)."""
+    output: list[str] = []
+    crash = data.get('crash', {})
+    threads = crash.get('threads', [])
+    image_names = ImageNames(crash.get('usedImages', []))
+
+    output.append(SEP_EQ)
+    output.append(f"All Threads: {Path(filepath).name}")
+    output.append(f"Total threads: {len(threads)}")
+    output.append(SEP_EQ)
+
+    for t_idx, thread in enumerate(threads):
+        frames = thread.get('frames', [])
+        triggered = thread.get('triggered', False)
+        thread_name = thread.get('name', '')
+        thread_id = thread.get('id', t_idx)
+
+        # Check if this thread has interesting (non-panic) frames
+        interesting_frames = []
+        for frame in frames[:30]:
+            symbol = frame['symbol']
+            # Skip panic symbols for cleaner output
+            is_panic = THREAD_PANIC_SYMBOLS_RE.search(symbol) is not None
+            if symbol and not is_panic:
+                interesting_frames.append(frame)
+
+        # Skip threads with only panic frames or no symbols
+        if not interesting_frames and not triggered:
+            continue
+
+        marker = " <<< CRASHED" if triggered else ""
+        output.append(f"\n--- Thread {thread_id}{' (' + thread_name + ')' if thread_name else ''}{marker} ---")
+        output.append(f"    Frames: {len(frames)}, Interesting: {len(interesting_frames)}")
+
+        # Show first few interesting frames
+        for i, frame in enumerate(interesting_frames[:10]):
+            symbol, img_idx, _ = FRAME_FIELDS(frame)
+            img_name = image_names[img_idx] if img_idx < len(image_names) else f'image_{img_idx}'
+            output.append(f"      [{i:2d}] {symbol[:70]}")
+            if img_name:
+                output.append(f"           ({img_name})")
+
+        if len(interesting_frames) > 10:
+            output.append(f"      ... {len(interesting_frames) - 10} more frames ...")
+
+    return '\n'.join(output)
+
+
+def format_raw_stack(data: dict[str, Any], filepath: str) -> str:
+    """Format the top and bottom frames of the crashed thread, unfiltered."""
+    output: list[str] = []
+    crash = data.get('crash', {})
+    threads = crash.get('threads', [])
+    image_names = ImageNames(crash.get('usedImages', []))
+
+    crashed_thread = None
+    for t in threads:
+        if t.get('triggered'):
+            crashed_thread = t
+            break
+
+    if not crashed_thread:
+        return ''
+
+    frames = crashed_thread.get('frames', [])
+    output.append(SEP_EQ)
+    output.append(f"Raw Stack: {Path(filepath).name}")
+    output.append(f"Thread: {crashed_thread.get('name', 'unknown')}")
+    output.append(f"Total frames: {len(frames)}")
+    output.append(SEP_EQ)
+
+    # Show first 20 and last 20 frames
+    output.append("\n--- Top of stack (most recent) ---")
+    for i, frame in enumerate(islice(frames, 20)):
+        symbol, img_idx, _ = FRAME_FIELDS(frame)
+        symbol = symbol or '<no symbol>'
+        img_name = image_names[img_idx] if img_idx < len(image_names) else f'image_{img_idx}'
+        output.append(f"  [{i:3d}] {symbol[:80]}")
+        output.append(f"        ({img_name})")
+
+    if len(frames) > 40:
+        output.append(f"\n  ... {len(frames) - 40} frames omitted ...")
+
+    output.append("\n--- Bottom of stack (oldest / crash origin) ---")
+    start = max(20, len(frames) - 20)
+    for i, frame in enumerate(islice(frames, start, None), start):
+        symbol, img_idx, _ = FRAME_FIELDS(frame)
+        symbol = symbol or '<no symbol>'
+        img_name = image_names[img_idx] if img_idx < len(image_names) else f'image_{img_idx}'
+        output.append(f"  [{i:3d}] {symbol[:80]}")
+        output.append(f"        ({img_name})")
+
+    return '\n'.join(output)
+
+
+def format_origin_report(data: dict[str, Any], filepath: str) -> str:
+    """Format only the crash origin frames (non-panic)."""
+    output: list[str] = []
+    output.append(SEP_EQ)
+    output.append(f"Crash Origin: {Path(filepath).name}")
+    output.append(SEP_EQ)
+
+    origin_frames = find_crash_origin(data)
+    if origin_frames:
+        output.append(f"\nFound {len(origin_frames)} non-panic frames:")
+        output.append(SEP_DASH)
+        for f in origin_frames[:30]:
+            output.append(f"  [{f['index']:3d}] {f['symbol']}")
+            output.append(f"        ({f['image']} + {f['offset']})")
+    else:
+        output.append("\nNo non-panic frames found (entire stack is panic handlers)")
+
+    return '\n'.join(output)
+
+
+def get_latest_crashes(count: int = 1) -> list[str]:
     """Get paths to the most recent Clauntty crash reports."""
-    crash_dir = Path.home() / "Library/Logs/DiagnosticReports"
-    if not crash_dir.exists():
+    if not os.path.isdir(CRASH_DIR):
         return []
 
-    crashes = list(crash_dir.glob("Clauntty-*.ips"))
-    crashes.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return crashes[:count]
+    # A prefix/suffix check on scandir entries avoids glob's fnmatch. Sorting
+    # still stats each file: only Windows fills DirEntry.stat() from the
+    # directory read.
+    with os.scandir(CRASH_DIR) as it:
+        crashes = [e for e in it if e.name.startswith('Clauntty-') and e.name.endswith('.ips')]
+    crashes.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [e.path for e in crashes[:count]]
+
+
+def process_crash(filepath: str, show_threads: bool, show_raw: bool, show_origin: bool) -> str:
+    """Parse one crash report and format it for the selected view."""
+    if show_threads:
+        return format_threads_report(parse_ips_file(filepath), filepath)
+
+    if show_raw:
+        return format_raw_stack(parse_ips(filepath, STACK_KEYS), filepath)
+    if show_origin:
+        return format_origin_report(parse_ips(filepath, STACK_KEYS), filepath)
+    return format_crash_report(parse_ips(filepath), filepath)
+
+
+def write_report(filepath: str, get_report: Callable[[], str]) -> None:
+    """Write the report returned by `get_report`, or the error it raised."""
+    try:
+        report = get_report()
+    except Exception as e:
+        print(f"Error parsing {filepath}: {e}")
+        import traceback
+        traceback.print_exc()
+        return
 
+    # Emit each report with a single write rather than a print per line
+    if report:
+        report += '\n'
+    sys.stdout.write(report + '\n')
 
-def main():
+
+def main() -> None:
     args = sys.argv[1:]
 
     if not args:
@@ -279,7 +648,7 @@ def main():
     if show_threads:
         args = [a for a in args if a != '--threads']
 
-    filepaths = []
+    filepaths: list[str] = []
 
     if not args or args[0] == '--latest':
         count = int(args[1]) if len(args) > 1 and args[0] == '--latest' else 1
@@ -292,134 +661,23 @@ def main():
         if not os.path.exists(filepath):
             print(f"File not found: {filepath}")
             sys.exit(1)
-        filepaths = [Path(filepath)]
-
-    for filepath in filepaths:
-        try:
-            data = parse_ips_file(str(filepath))
-
-            if show_threads:
-                # Show all threads to find the actual crash cause
-                crash = data.get('crash', {})
-                threads = crash.get('threads', [])
-                used_images = crash.get('usedImages', [])
-
-                print(f"{'='*60}")
-                print(f"All Threads: {Path(filepath).name}")
-                print(f"Total threads: {len(threads)}")
-                print(f"{'='*60}")
-
-                # Skip panic symbols for cleaner output
-                panic_symbols = {'panicExtra', 'defaultPanic', 'SignalHandler', '_sigtramp',
-                                'pthread_kill', 'abort', '__ubsan_handle', 'breakpad'}
-
-                for t_idx, thread in enumerate(threads):
-                    frames = thread.get('frames', [])
-                    triggered = thread.get('triggered', False)
-                    thread_name = thread.get('name', '')
-                    thread_id = thread.get('id', t_idx)
-
-                    # Check if this thread has interesting (non-panic) frames
-                    interesting_frames = []
-                    for frame in frames[:30]:
-                        symbol = frame.get('symbol', '')
-                        is_panic = any(ps in symbol for ps in panic_symbols)
-                        if symbol and not is_panic:
-                            interesting_frames.append(frame)
-
-                    # Skip threads with only panic frames or no symbols
-                    if not interesting_frames and not triggered:
-                        continue
-
-                    marker = " <<< CRASHED" if triggered else ""
-                    print(f"\n--- Thread {thread_id}{' (' + thread_name + ')' if thread_name else ''}{marker} ---")
-                    print(f"    Frames: {len(frames)}, Interesting: {len(interesting_frames)}")
-
-                    # Show first few interesting frames
-                    for i, frame in enumerate(interesting_frames[:10]):
-                        symbol = frame.get('symbol', '<no symbol>')
-                        img_idx = frame.get('imageIndex', 0)
-                        if img_idx < len(used_images):
-                            img_name = Path(used_images[img_idx].get('path', '')).name
-                        else:
-                            img_name = f'image_{img_idx}'
-                        print(f"      [{i:2d}] {symbol[:70]}")
-                        if img_name:
-                            print(f"           ({img_name})")
-
-                    if len(interesting_frames) > 10:
-                        print(f"      ... {len(interesting_frames) - 10} more frames ...")
-
-            elif show_raw:
-                # Show all frames raw
-                crash = data.get('crash', {})
-                threads = crash.get('threads', [])
-                used_images = crash.get('usedImages', [])
-
-                crashed_thread = None
-                for t in threads:
-                    if t.get('triggered'):
-                        crashed_thread = t
-                        break
-
-                if crashed_thread:
-                    frames = crashed_thread.get('frames', [])
-                    print(f"{'='*60}")
-                    print(f"Raw Stack: {Path(filepath).name}")
-                    print(f"Thread: {crashed_thread.get('name', 'unknown')}")
-                    print(f"Total frames: {len(frames)}")
-                    print(f"{'='*60}")
-
-                    # Show first 20 and last 20 frames
-                    print("\n--- Top of stack (most recent) ---")
-                    for i, frame in enumerate(frames[:20]):
-                        symbol = frame.get('symbol', '<no symbol>')
-                        img_idx = frame.get('imageIndex', 0)
-                        if img_idx < len(used_images):
-                            img_name = Path(used_images[img_idx].get('path', '')).name
-                        else:
-                            img_name = f'image_{img_idx}'
-                        print(f"  [{i:3d}] {symbol[:80]}")
-                        print(f"        ({img_name})")
-
-                    if len(frames) > 40:
-                        print(f"\n  ... {len(frames) - 40} frames omitted ...")
-
-                    print("\n--- Bottom of stack (oldest / crash origin) ---")
-                    start = max(20, len(frames) - 20)
-                    for i, frame in enumerate(frames[start:], start):
-                        symbol = frame.get('symbol', '<no symbol>')
-                        img_idx = frame.get('imageIndex', 0)
-                        if img_idx < len(used_images):
-                            img_name = Path(used_images[img_idx].get('path', '')).name
-                        else:
-                            img_name = f'image_{img_idx}'
-                        print(f"  [{i:3d}] {symbol[:80]}")
-                        print(f"        ({img_name})")
-            elif show_origin:
-                # Show only crash origin frames (non-panic)
-                print(f"{'='*60}")
-                print(f"Crash Origin: {Path(filepath).name}")
-                print(f"{'='*60}")
-
-                origin_frames = find_crash_origin(data)
-                if origin_frames:
-                    print(f"\nFound {len(origin_frames)} non-panic frames:")
-                    print("-" * 60)
-                    for f in origin_frames[:30]:
-                        print(f"  [{f['index']:3d}] {f['symbol']}")
-                        print(f"        ({f['image']} + {f['offset']})")
-                else:
-                    print("\nNo non-panic frames found (entire stack is panic handlers)")
-            else:
-                report = format_crash_report(data, str(filepath))
-                print(report)
-
-            print()
-        except Exception as e:
-            print(f"Error parsing {filepath}: {e}")
-            import traceback
-            traceback.print_exc()
+        filepaths = [filepath]
+
+    options = (show_threads, show_raw, show_origin)
+    if len(filepaths) == 1:
+        write_report(filepaths[0], lambda: process_crash(filepaths[0], *options))
+        return
+
+    # Crash files are independent, so parse and format them in parallel.
+    # Reports are still written in the order the files were listed. The pool
+    # is imported here so single-file runs don't pay for multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(len(filepaths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_crash, filepath, *options) for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            write_report(filepath, future.result)
 
 
 if __name__ == '__main__':
@@ -14,6 +14,10 @@ import sys
 import tempfile
 from pathlib import Path
 
+# Column rules for the session tables
+SID_SEP = "-" * 38
+TITLE_SEP = "-" * 30
+
 
 def run(cmd: list[str], capture=True) -> str:
     """Run a command and return stdout."""
@@ -25,7 +29,7 @@ def pull_ios_prefs(temp_dir: Path) -> dict:
     """Pull preferences plist from connected iPhone."""
     plist_path = temp_dir / "prefs.plist"
 
-    subprocess.run([
+    result = subprocess.run([
         "xcrun", "devicectl", "device", "copy", "from",
         "--device", "iPhone 16",
         "--source", "Library/Preferences/com.octerm.clauntty.plist",
@@ -34,16 +38,24 @@ def pull_ios_prefs(temp_dir: Path) -> dict:
         "--destination", str(plist_path)
     ], capture_output=True)
 
-    if not plist_path.exists():
-        print("Failed to pull iOS preferences")
-        return {}
+    # devicectl exits non-zero when the copy fails, so there's no need to
+    # stat the destination before reading it
+    if result.returncode == 0:
+        try:
+            return plistlib.loads(plist_path.read_bytes())
+        except OSError:
+            pass
 
-    with open(plist_path, "rb") as f:
-        return plistlib.load(f)
+    print("Failed to pull iOS preferences")
+    return {}
 
 
 def get_server_sessions(ssh_host: str) -> tuple[dict[str, str], dict[str, tuple[str, str]]]:
     """Get session titles and active sockets from server."""
+    # Titles and sockets are listed by one remote script, so only one SSH
+    # connection is made. A marker line separates the two sections.
+    marker = "---SOCKETS---"
+
     # Get titles
     titles_cmd = '''for f in ~/.clauntty/sessions/*.title; do
         id=$(basename "$f" .title)
@@ -51,14 +63,6 @@ def get_server_sessions(ssh_host: str) -> tuple[dict[str, str], dict[str, tuple[
         echo "$id|$title"
     done'''
 
-    result = subprocess.run(["ssh", ssh_host, titles_cmd], capture_output=True, text=True)
-
-    titles = {}
-    for line in result.stdout.strip().split("\n"):
-        if "|" in line:
-            sid, title = line.split("|", 1)
-            titles[sid] = title
-
     # Get sockets and check if they have a listening process
     sockets_cmd = '''for f in ~/.clauntty/sessions/*; do
         if [ -S "$f" ]; then
@@ -72,16 +76,30 @@ def get_server_sessions(ssh_host: str) -> tuple[dict[str, str], dict[str, tuple[
         fi
     done'''
 
-    result = subprocess.run(["ssh", ssh_host, sockets_cmd], capture_output=True, text=True)
+    sessions_cmd = f"{titles_cmd}\necho '{marker}'\n{sockets_cmd}"
 
+    titles = {}
     sockets = {}  # sid -> (status, pid)
-    for line in result.stdout.strip().split("\n"):
-        if "|" in line:
-            parts = line.strip().split("|")
-            if len(parts) >= 2:
-                sid, status = parts[0], parts[1]
-                pid = parts[2] if len(parts) > 2 else ""
-                sockets[sid] = (status, pid)
+    in_sockets = False
+
+    # Parse lines as they arrive instead of buffering the whole output
+    with subprocess.Popen(["ssh", ssh_host, sessions_cmd], stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL, text=True) as proc:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line == marker:
+                in_sockets = True
+            elif "|" not in line:
+                continue
+            elif in_sockets:
+                parts = line.strip().split("|")
+                if len(parts) >= 2:
+                    sid, status = parts[0], parts[1]
+                    pid = parts[2] if len(parts) > 2 else ""
+                    sockets[sid] = (status, pid)
+            else:
+                sid, title = line.split("|", 1)
+                titles[sid] = title
 
     return titles, sockets
 
@@ -116,7 +134,7 @@ def main():
         print("=== iOS Device Tabs ===")
         print()
         print(f"{'Tab':<4} {'Session ID':<38} {'iOS Cached Title':<30} {'Server Title':<30} {'Status'}")
-        print(f"{'---':<4} {'-'*38:<38} {'-'*30:<30} {'-'*30:<30} {'------'}")
+        print(f"{'---':<4} {SID_SEP} {TITLE_SEP} {TITLE_SEP} {'------'}")
 
         for i, tab in enumerate(tabs):
             sid = tab.get("rtachSessionId", "N/A")
@@ -138,7 +156,7 @@ def main():
         print("=== All Server Sessions ===")
         print()
         print(f"{'Session ID':<38} {'Title':<30} {'Status'}")
-        print(f"{'-'*38:<38} {'-'*30:<30} {'------'}")
+        print(f"{SID_SEP} {TITLE_SEP} {'------'}")
 
         for sid, title in sorted(server_titles.items()):
             if sid in active_sockets: